@@ -67,6 +67,72 @@ def run():
     # Run
     ###############################################################################################
 
+    # Each a_fmt is tested independently, returning one tuple per test:
+    # (output, a_fmt, shift, r_fmt, rnd, sat)
+    def run_a_fmt(a_fmt):
+        tests = []
+        
+        # Generate A data
+        a = get_data(a_fmt)
+        a_wide = WideFix.from_narrowfix(NarrowFix(a, a_fmt))
+        
+        for shift in shift_values:
+            # The lossless shift does not depend on r_fmt, rnd or sat, so calculate it once.
+            # cl_fix_shift(a, a_fmt, shift, r_fmt, rnd, sat) is equivalent to this lossless shift,
+            # followed by cl_fix_round and cl_fix_saturate.
+            mid_fmt = cl_fix_shift_fmt(a_fmt, shift)
+            mid = cl_fix_shift(a, a_fmt, shift, mid_fmt)
+            
+            # Test WideFix input here, as there is no separate test script.
+            # This is not actually part of the cosim data generation.
+            mid_wide = a_wide.shift(shift)
+            
+            #########
+            # r_fmt #
+            #########
+            for rS in rS_values:
+                for rI in rI_values:
+                    for rF in rF_values:
+                        
+                        # Skip unusable formats
+                        if rS+rI+rF < 1:
+                            continue
+                        
+                        r_fmt = FixFormat(rS, rI, rF)
+                        
+                        #######
+                        # rnd #
+                        #######
+                        for rnd in rnd_values:
+                            # Rounding does not depend on sat, so calculate it once
+                            rounded_fmt = cl_fix_round_fmt(mid_fmt, r_fmt.F, rnd)
+                            rounded = cl_fix_round(mid, mid_fmt, rounded_fmt, rnd)
+                            rounded_wide = mid_wide.round(rounded_fmt, rnd)
+                            
+                            #######
+                            # sat #
+                            #######
+                            for sat in sat_values:
+                                # Calculate output
+                                r = cl_fix_saturate(rounded, rounded_fmt, r_fmt, sat)
+                                
+                                # Check WideFix
+                                r_wide = rounded_wide.saturate(r_fmt, sat)
+                                assert np.array_equal(r_wide.to_real(), r)
+                                
+                                tests.append((cl_fix_to_integer(r, r_fmt), a_fmt, shift, r_fmt,
+                                              rnd.value, sat.value))
+        return tests
+
+    #########
+    # a_fmt #
+    #########
+    a_fmts = [
+        FixFormat(aS, aI, aF)
+        for aS in aS_values for aI in aI_values for aF in aF_values
+        if aS+aI+aF >= 1  # Skip unusable formats
+    ]
+
     test_count = 0
 
     test_a_fmt = []
@@ -74,71 +140,25 @@ def run():
     test_r_fmt = []
     test_rnd = []
     test_sat = []
-
-    #########
-    # a_fmt #
-    #########
-    progress = ProgressReporter((aS_values, aI_values, aF_values))
-    for aS in aS_values:
-        for aI in aI_values:
-            for aF in aF_values:
-                # Report progress
-                progress.report()
-                
-                # Skip unusable formats
-                if aS+aI+aF < 1:
-                    continue
-                
-                a_fmt = FixFormat(aS, aI, aF)
-                
-                # Generate A data
-                a = get_data(a_fmt)
-                a_wide = WideFix.from_narrowfix(NarrowFix(a, a_fmt))
-                
-                for shift in shift_values:
-                    
-                    #########
-                    # r_fmt #
-                    #########
-                    for rS in rS_values:
-                        for rI in rI_values:
-                            for rF in rF_values:
-                                
-                                # Skip unusable formats
-                                if rS+rI+rF < 1:
-                                    continue
-                                
-                                r_fmt = FixFormat(rS, rI, rF)
-                                
-                                #######
-                                # rnd #
-                                #######
-                                for rnd in rnd_values:
-                                    #######
-                                    # sat #
-                                    #######
-                                    for sat in sat_values:
-                                        # Calculate output
-                                        r = cl_fix_shift(a, a_fmt, shift, r_fmt, rnd, sat)
-                                        
-                                        # Test WideFix input here, as there is no separate test script.
-                                        # This is not actually part of the cosim data generation.
-                                        r_wide = a_wide.shift(shift, r_fmt, rnd, sat)
-                                        assert np.array_equal(r_wide.to_real(), r)
-                                        
-                                        # Save output to file
-                                        np.savetxt(join(DATA_DIR, f"test{test_count}_output.txt"),
-                                                   cl_fix_to_integer(r, r_fmt),
-                                                   fmt="%i", header=f"r[{r.size}]")
-                                        
-                                        # Save test parameters into lists
-                                        test_a_fmt.append(a_fmt)
-                                        test_shift.append(shift)
-                                        test_r_fmt.append(r_fmt)
-                                        test_rnd.append(rnd.value)
-                                        test_sat.append(sat.value)
-                                        
-                                        test_count += 1
+    test_output = []
+
+    progress = ProgressReporter((a_fmts,))
+    for a_fmt in a_fmts:
+        tests = run_a_fmt(a_fmt)
+        
+        # Report progress
+        progress.report()
+        
+        # Save output and test parameters into lists
+        for output, a_fmt, shift, r_fmt, rnd, sat in tests:
+            test_output.append(output)
+            test_a_fmt.append(a_fmt)
+            test_shift.append(shift)
+            test_r_fmt.append(r_fmt)
+            test_rnd.append(rnd)
+            test_sat.append(sat)
+            
+            test_count += 1
 
     print(f"Cosim generated {test_count} tests.")
 
@@ -155,6 +175,10 @@ def run():
     # Save rounding and saturation modes
     np.savetxt(join(DATA_DIR, f"rnd.txt"), test_rnd, fmt="%i", header=f"Rounding modes")
     np.savetxt(join(DATA_DIR, f"sat.txt"), test_sat, fmt="%i", header=f"Saturation modes")
+    
+    # Save outputs. All tests are concatenated into a single file (much faster than one file per
+    # test). The testbench reads the values back sequentially, in the same order.
+    np.savetxt(join(DATA_DIR, f"output.txt"), np.concatenate(test_output), fmt="%i", header=f"Outputs")
 
 ###################################################################################################
 # Support execution as a script
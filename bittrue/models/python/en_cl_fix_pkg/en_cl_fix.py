@@ -89,7 +89,7 @@ def cl_fix_max_value(fmt : FixFormat):
     Returns the maximum representable value in a specific fixed-point format.
     """
     if cl_fix_is_wide(fmt):
-        return WideFix.max_value(fmt)._data
+        return WideFix.max_value(fmt).data_as_object()
     else:
         return NarrowFix.max_value(fmt)._data
 
@@ -99,7 +99,7 @@ def cl_fix_min_value(fmt : FixFormat):
     Returns the minimum representable value in a specific fixed-point format.
     """
     if cl_fix_is_wide(fmt):
-        return WideFix.min_value(fmt)._data
+        return WideFix.min_value(fmt).data_as_object()
     else:
         return NarrowFix.min_value(fmt)._data
 
@@ -137,7 +137,7 @@ def cl_fix_from_real(a, r_fmt : FixFormat, saturate : FixSaturate = FixSaturate.
     a = _clean_input(a)
     
     if cl_fix_is_wide(r_fmt):
-        return WideFix.from_real(a, r_fmt, saturate)._data
+        return WideFix.from_real(a, r_fmt, saturate).data_as_object()
     else:
         return NarrowFix.from_real(a, r_fmt, saturate)._data
 
@@ -209,7 +209,8 @@ def cl_fix_round(a, a_fmt : FixFormat, r_fmt : int, rnd : FixRound):
         # NarrowFix
         r = NarrowFix(a, a_fmt, copy=False).round(r_fmt, rnd)
     
-    return r._data
+    # Wide data is always returned as arbitrary-precision int
+    return r.data_as_object() if r_wide else r._data
 
 
 def cl_fix_saturate(a, a_fmt : FixFormat, r_fmt : FixFormat, sat : FixSaturate):
@@ -234,7 +235,8 @@ def cl_fix_saturate(a, a_fmt : FixFormat, r_fmt : FixFormat, sat : FixSaturate):
         # NarrowFix
         r = NarrowFix(a, a_fmt, copy=False).saturate(r_fmt, sat)
     
-    return r._data
+    # Wide data is always returned as arbitrary-precision int
+    return r.data_as_object() if r_wide else r._data
 
 
 def cl_fix_resize(a, a_fmt : FixFormat,
@@ -497,7 +499,7 @@ def cl_fix_random(shape, fmt : FixFormat):
         for i in range(n):
             xint[i] = random.randrange(int(fmt_min), int(fmt_max)+1)
         
-        return WideFix(xint.reshape(shape), fmt)._data
+        return WideFix(xint.reshape(shape), fmt).data_as_object()
     else:
         int_min = fmt_min*2**fmt.F
         int_max = fmt_max*2**fmt.F
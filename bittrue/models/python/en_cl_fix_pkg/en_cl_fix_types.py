@@ -24,7 +24,7 @@
 ###################################################################################################
 
 from enum import Enum
-from copy import copy as shallow_copy
+from functools import lru_cache
 
 
 class FixRound(Enum):
@@ -56,6 +56,9 @@ class FixFormat:
         S = Number of sign bits (0 or 1).
         I = Number of integer bits.
         F = Number of fractional bits.
+    
+    FixFormat is immutable, so it can safely be shared (e.g. by NarrowFix/WideFix objects) without
+    copying. It is also hashable, so the result formats of operations (for_add() etc.) are cached.
     """
     
     def __init__(self, S : int, I : int, F : int):
@@ -65,12 +68,21 @@ class FixFormat:
         # We do not allow signed null formats such as (1,-1,0) or negative widths such as (0,-1,0)
         # as they create awkward edge cases (e.g. in cl_fix_max_value) and have no practical use.
         assert I+F >= 0, "I+F must be at least 0"
-        self.S = int(S)
-        self.I = int(I)
-        self.F = int(F)
+        object.__setattr__(self, "S", int(S))
+        object.__setattr__(self, "I", int(I))
+        object.__setattr__(self, "F", int(F))
+    
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("FixFormat is immutable")
+    
+    
+    def __delattr__(self, name):
+        raise AttributeError("FixFormat is immutable")
     
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def for_add(a_fmt, b_fmt):
         """
         Returns the minimal FixFormat that is guaranteed to exactly represent the result of an
@@ -122,6 +134,7 @@ class FixFormat:
     
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def for_sub(a_fmt, b_fmt):
         """
         Returns the minimal FixFormat that is guaranteed to exactly represent the result of a
@@ -184,6 +197,7 @@ class FixFormat:
     
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def for_addsub(a_fmt, b_fmt):
         """
         Returns the minimal FixFormat that is guaranteed to exactly represent the result of an
@@ -199,6 +213,7 @@ class FixFormat:
     
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def for_mult(a_fmt, b_fmt):
         """
         Returns the minimal FixFormat that is guaranteed to exactly represent the result of a
@@ -270,6 +285,7 @@ class FixFormat:
     
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def for_neg(a_fmt):
         """
         Returns the minimal FixFormat that is guaranteed to exactly represent the result of a
@@ -286,6 +302,7 @@ class FixFormat:
     
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def for_abs(a_fmt):
         """
         Returns the minimal FixFormat that is guaranteed to exactly represent the result of an
@@ -316,6 +333,7 @@ class FixFormat:
     
     # Format for result of rounding
     @staticmethod
+    @lru_cache(maxsize=1024)
     def for_round(a_fmt, rFracBits : int, rnd : FixRound):
         """
         Returns the minimal FixFormat that is guaranteed to exactly represent the result of
@@ -354,12 +372,7 @@ class FixFormat:
         else:
             fmts = (a_fmt, b_fmt)
         
-        r_fmt = shallow_copy(fmts[0])
-        for i in range(1, len(fmts)):
-            r_fmt.S = max(r_fmt.S, fmts[i].S)
-            r_fmt.I = max(r_fmt.I, fmts[i].I)
-            r_fmt.F = max(r_fmt.F, fmts[i].F)
-        return r_fmt
+        return FixFormat(max(fmt.S for fmt in fmts), max(fmt.I for fmt in fmts), max(fmt.F for fmt in fmts))
     
     
     def __repr__(self):
@@ -374,6 +387,10 @@ class FixFormat:
         return (self.S == other.S) and (self.I == other.I) and (self.F == other.F)
     
     
+    def __hash__(self):
+        return hash((self.S, self.I, self.F))
+    
+    
     @property
     def width(self):
         """
@@ -25,17 +25,20 @@ def to_uint64_array(data, fmt : FixFormat):
     # Calculate number of uint64s needed per element
     n_ints = (fmt.width + 63) // 64  # ceil(width / 64)
 
-    # Cast signed data to unsigned by reintepreting the sign bit
+    # Copy, so the caller's data is not modified in-place
+    data = data.copy()
+    
+    # Cast signed data to unsigned by reintepreting the sign bit (only negative values need modifying)
     if fmt.S == 1:
-        data = np.where(data < 0, data + 2**fmt.width, data)
+        data[data < 0] += 2**fmt.width
     
-    # Populate uint64 array
-    result = np.empty(data.shape + (n_ints,), dtype=np.uint64)
-    for i in range(n_ints):
-        result[..., i] = data % 2**64
-        data >>= 64
+    # Populate uint64 array. Each int is converted to little-endian bytes in a single call, so the
+    # bytes of each element are its uint64s (least significant first).
+    n_bytes = 8*n_ints
+    buffer = b"".join([x.to_bytes(n_bytes, "little") for x in data.flat])
     
-    return result
+    # Copy out of the (read-only) buffer
+    return np.frombuffer(buffer, dtype="<u8").reshape(data.shape + (n_ints,)).astype(np.uint64)
 
 def from_uint64_array(data, fmt : FixFormat):
     """
@@ -47,12 +50,13 @@ def from_uint64_array(data, fmt : FixFormat):
     assert isinstance(data, np.ndarray), f"Unexpected input type. Expected: np.ndarray. Got: {type(data)}."
     assert data.dtype == np.uint64, f"Unexpected input dtype. Expected: np.uint64. Got: {data.dtype}."
     
-    # Weighted sum to recombine uint64s into wide *unsigned* integers
-    weights = 2**(64*np.arange(data.shape[-1]).astype(object))
-    result = np.matmul(data, weights.T)
+    # Recombine uint64s into wide *unsigned* integers, starting from the most significant
+    result = data[..., -1].astype(object)
+    for i in range(data.shape[-1]-2, -1, -1):
+        result = (result << 64) | data[..., i].astype(object)
     
-    # Handle the sign bit
+    # Handle the sign bit (only negative values need modifying)
     if fmt.S == 1:
-        result = np.where(result >= 2**(fmt.I+fmt.F), result - 2**(fmt.I+fmt.F+1), result)
+        result[result >= 2**(fmt.I+fmt.F)] -= 2**(fmt.I+fmt.F+1)
     
     return result
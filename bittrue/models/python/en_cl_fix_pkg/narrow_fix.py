@@ -30,7 +30,6 @@
 
 import numpy as np
 import warnings
-from copy import copy as shallow_copy
 
 from .en_cl_fix_types import *
 
@@ -61,8 +60,8 @@ class NarrowFix:
             self._data = data.copy()
         else:
             self._data = data
-        # Always copy the format (very small)
-        self._fmt = shallow_copy(fmt)
+        # FixFormat is immutable, so it can be shared without copying
+        self._fmt = fmt
         
     @staticmethod
     def from_real(a, r_fmt : FixFormat, saturate : FixSaturate = FixSaturate.SatWarn_s):
@@ -132,9 +131,9 @@ class NarrowFix:
     @property
     def fmt(self):
         """
-        Returns a copy of the fixed-point format.
+        Returns the (immutable) fixed-point format.
         """
-        return shallow_copy(self._fmt)
+        return self._fmt
     
     def to_integer(self):
         """
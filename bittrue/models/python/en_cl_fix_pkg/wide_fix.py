@@ -22,8 +22,9 @@
 #
 # The WideFix class adds arbitrary-precision support to en_cl_fix_pkg.
 #
-# Internal data is stored in arbitrary-precision Python integers and all calculations are performed
-# on (wide) integers. This differs from NarrowFix, which uses (double-precision) floats.
+# Internal data is stored in integers and all calculations are performed on (wide) integers. This
+# differs from NarrowFix, which uses (double-precision) floats. Formats up to 62 bits wide are stored
+# as native np.int64 and wider formats as arbitrary-precision Python integers (dtype == object).
 #
 # Therefore, WideFix internal data is not explicitly normalized according to the fractional bits.
 # For example, the fixed-point number 1.25 in FixFormat(0,2,4) has binary representation "01.0100".
@@ -34,13 +35,105 @@
 # widths exceeding 53 bits.
 ###################################################################################################
 
+import math
 import warnings
 import numpy as np
-from copy import copy as shallow_copy
-from copy import deepcopy as deep_copy
 
 from .en_cl_fix_types import *
 
+###################################################################################################
+# Private helpers
+###################################################################################################
+
+# Multi-step calculations (e.g. rounding, wrapping) are much faster in native int64 arithmetic than
+# in arbitrary-precision Python ints. This is safe for formats up to 62 bits wide, which leaves 1 bit
+# of headroom for intermediate results (e.g. wrapping offsets).
+_INT64_MAX_WIDTH = 62
+
+def _fits_int64(*fmts):
+    """
+    Private helper that checks whether a calculation involving the given formats can be done in
+    native int64 arithmetic.
+    
+    Note: The union format is checked (not just each individual format) because intermediate results
+    keep the LSBs of one format and the MSBs of another. For example, a rounding offset is added
+    before truncating, so it needs the int bits of the output and the frac bits of the input.
+    """
+    return FixFormat.union(fmts).width <= _INT64_MAX_WIDTH
+
+def _internal_dtype(fmt):
+    """
+    Private helper that returns the internal data representation for a given FixFormat: np.int64 if
+    it fits, else arbitrary-precision int (dtype == object).
+    """
+    return np.int64 if fmt.width <= _INT64_MAX_WIDTH else object
+
+def _as_internal(data, fmt):
+    """
+    Private helper that casts integer data to the internal representation for a given FixFormat
+    (without copying, if it already matches). This must be done *before* calculating results in fmt,
+    so that native int64 operands never overflow.
+    """
+    return data.astype(_internal_dtype(fmt), copy=False)
+
+def _max_int(fmt):
+    """
+    Private helper that returns the maximum internal integer value for a given FixFormat.
+    """
+    return 2**(fmt.I+fmt.F)-1
+
+def _min_int(fmt):
+    """
+    Private helper that returns the minimum internal integer value for a given FixFormat.
+    """
+    return -2**(fmt.I+fmt.F) if fmt.S == 1 else 0
+
+# Rounding offsets, one function per rounding mode. Each adds the offset that must be applied before
+# truncating 'shift' LSBs, where half = 2**(shift-1) is the weight of the MSB being truncated.
+# Note: FixRound.Trunc_s needs no offset (it is handled directly in WideFix.round).
+
+def _offset_nonsym_pos(val, shift, half):
+    # Half-up => Round to "nearest", all ties rounded towards +Inf.
+    return val + half               # + "half"
+
+def _offset_nonsym_neg(val, shift, half):
+    # Half-down => Round to "nearest", all ties rounded towards -Inf.
+    return val + (half - 1)         # + "half"-delta
+
+def _offset_sym_inf(val, shift, half):
+    # Half-away-from-zero => Round to "nearest", all ties rounded away from zero.
+    #                     => Half-up for val>0. Half-down for val<0.
+    return val + (half - (val < 0).astype(val.dtype))
+
+def _offset_sym_zero(val, shift, half):
+    # Half-towards-zero => Round to "nearest", all ties rounded towards zero.
+    #                   => Half-up for val<0. Half-down for val>0.
+    return val + (half - (val >= 0).astype(val.dtype))
+
+def _offset_conv_even(val, shift, half):
+    # Convergent-even => Round to "nearest", all ties rounded to nearest "even" number (b"X..XX0").
+    #                 => Half-down for trunc(val) even, else half-up.
+    trunc_a_isodd = (val >> shift) & 1
+    return val + (trunc_a_isodd + (half - 1))
+
+def _offset_conv_odd(val, shift, half):
+    # Convergent-odd => Round to "nearest", all ties rounded to nearest "odd" number (b"X..XX1").
+    #                => Half-down for trunc(val) odd, else half-up.
+    trunc_a_isodd = (val >> shift) & 1
+    return val + (half - trunc_a_isodd)
+
+_ROUND_OFFSET = {
+    FixRound.NonSymPos_s : _offset_nonsym_pos,
+    FixRound.NonSymNeg_s : _offset_nonsym_neg,
+    FixRound.SymInf_s    : _offset_sym_inf,
+    FixRound.SymZero_s   : _offset_sym_zero,
+    FixRound.ConvEven_s  : _offset_conv_even,
+    FixRound.ConvOdd_s   : _offset_conv_odd,
+}
+
+###################################################################################################
+# WideFix class
+###################################################################################################
 
 class WideFix:
     
@@ -49,17 +142,30 @@ class WideFix:
         Constructs a WideFix object from the internal integer data representation.
         Example: the fixed-point value 3.0 in FixFormat(0,2,4) has internal data value 3.0*2**4 =
         48 (and *not* 3).
+        
+        Note: Data may be passed as native int (e.g. np.int64) or arbitrary-precision int
+        (dtype == object). It is stored as np.int64 if fmt fits, else as arbitrary-precision int.
         """
-        if isinstance(data, int):
-            data = np.array(data, dtype=object)
-        assert data.dtype == object, "WideFix: requires arbitrary-precision int (dtype == object)."
-        assert isinstance(data.flat[0], int), "WideFix: requires arbitrary-precision int (dtype == object)."
+        if isinstance(data, (int, np.integer)):
+            data = np.array(int(data), dtype=object)
+        if data.dtype == object:
+            assert isinstance(data.flat[0], int), "WideFix: requires integer data (native or arbitrary-precision int)."
+        else:
+            assert np.issubdtype(data.dtype, np.integer), "WideFix: requires integer data (native or arbitrary-precision int)."
+        # Convert to the internal representation for this format (if needed)
+        dtype = _internal_dtype(fmt)
+        if data.dtype != dtype:
+            data = data.astype(dtype)
+            copy = False
         if copy:
             self._data = data.copy()
         else:
-            self._data = data
-        # Always copy the format (very small)
-        self._fmt = shallow_copy(fmt)
+            # View, so that only our reference is made read-only (not the caller's array)
+            self._data = data.view()
+        # Internal data is never modified in-place, so it can be shared without copying
+        self._data.flags.writeable = False
+        # FixFormat is immutable, so it can be shared without copying
+        self._fmt = fmt
     
     @staticmethod
     def from_real(a, r_fmt : FixFormat, saturate : FixSaturate = FixSaturate.SatWarn_s):
@@ -69,31 +175,35 @@ class WideFix:
         Note: If a different rounding mode is needed, or if saturation is not desired, then use
         resize().
         """
-        # Saturation warning
+        max_val = _max_int(r_fmt)
+        min_val = _min_int(r_fmt)
+        scale = 2.0**r_fmt.F
+        
+        # Saturation warning (bounds checked on the scaled extremes, as plain ints)
         if (saturate == FixSaturate.SatWarn_s) or (saturate == FixSaturate.Warn_s):
             amax_float = np.max(a)
             amin_float = np.min(a)
-            amax = int(amax_float*2.0**r_fmt.F)
-            amin = int(amin_float*2.0**r_fmt.F)
-            if amax > WideFix.max_value(r_fmt)._data:
+            amax = math.floor(amax_float*scale)
+            amin = math.floor(amin_float*scale)
+            if amax > max_val:
                 warnings.warn(f"from_real: Number {amax_float} exceeds maximum for format {r_fmt}", Warning)
-            if amin < WideFix.min_value(r_fmt)._data:
+            if amin < min_val:
                 warnings.warn(f"from_real: Number {amin_float} exceeds minimum for format {r_fmt}", Warning)
         
         # Quantize. Always use half-up rounding.
-        x = a*(2.0**r_fmt.F) + 0.5
+        x = a*scale + 0.5
         
         # Try to force arbitrary-precision int representation
         if hasattr(x, 'astype'):
             x = x.astype('object')
             x = np.floor(x)
         else:
-            x = int(x)
+            x = np.array(math.floor(x), dtype=object)
         
         # Saturate
         if (saturate == FixSaturate.Sat_s) or (saturate == FixSaturate.SatWarn_s):
-            x = np.where(x > WideFix.max_value(r_fmt)._data, WideFix.max_value(r_fmt)._data, x)
-            x = np.where(x < WideFix.min_value(r_fmt)._data, WideFix.min_value(r_fmt)._data, x)
+            x = np.where(x > max_val, max_val, x)
+            x = np.where(x < min_val, min_val, x)
         else:
             # Wrapping has not been implemented
             raise NotImplementedError(f"WideFix: Unsupported saturation mode {str(saturate)}")
@@ -105,11 +215,8 @@ class WideFix:
         """
         Converts from NarrowFix to WideFix, without quantization or bounds checks.
         """
-        int_data = np.floor((a._data*2.0**a._fmt.F).astype(object))
-        
-        # Numpy behavior is not clearly defined. Sometimes we get np.float64.
-        if isinstance(int_data, np.float64):
-            int_data = int(int_data)
+        # NarrowFix data is at most 53 bits wide, so it always fits in np.int64
+        int_data = np.floor(np.asarray(a._data)*2.0**a._fmt.F).astype(np.int64)
         
         return WideFix(int_data, a._fmt, copy=False)
     
@@ -119,62 +226,73 @@ class WideFix:
         Converts from uint64 array (e.g. from MATLAB) to WideFix.
         """
         assert data.dtype == 'uint64', "from_uint64_array : requires input dtype == uint64."
-        # Weighted sum to recombine uint64s into wide *unsigned* integers
-        weights = 2**(64*np.arange(data.shape[0]).astype(object))
-        val = np.matmul(weights, data)
-        # Handle the sign bit
-        val = np.where(val >= 2**(fmt.I+fmt.F), val - 2**(fmt.I+fmt.F+1), val)
-        return WideFix(val, fmt)
+        # Recombine uint64s into wide *unsigned* integers, starting from the most significant
+        val = data[-1].astype(object)
+        for i in range(data.shape[0]-2, -1, -1):
+            val = (val << 64) | data[i].astype(object)
+        # Handle the sign bit (only negative values need modifying)
+        val[val >= 2**(fmt.I+fmt.F)] -= 2**(fmt.I+fmt.F+1)
+        return WideFix(val, fmt, copy=False)
     
     @staticmethod
     def max_value(fmt : FixFormat):
         """
         Calculates the maximum representable value for a given FixFormat.
         """
-        val = 2**(fmt.I+fmt.F)-1
-        return WideFix(val, fmt, copy=False)
+        return WideFix(_max_int(fmt), fmt, copy=False)
     
     @staticmethod
     def min_value(fmt : FixFormat):
         """
         Calculates the minimum representable value for a given FixFormat.
         """
-        if fmt.S == 1:
-            val = -2**(fmt.I+fmt.F)
-        else:
-            val = 0
-        return WideFix(val, fmt, copy=False)
+        return WideFix(_min_int(fmt), fmt, copy=False)
     
     @staticmethod
     def align_binary_points(values):
         """
         Aligns the binary points of 2 or more WideFix objects (e.g. to perform comparisons).
-        """
-        values = deep_copy(values)
         
+        Note: Inputs that are already aligned are returned as-is (not copied).
+        """
         # Find the maximum number of frac bits
-        Fmax = max(value.fmt.F for value in values)
-
-        # Resize every input to align binary points
-        for i, value in enumerate(values):
-            r_fmt = FixFormat(value.fmt.S, value.fmt.I, Fmax)
-            values[i] = value.resize(r_fmt)
+        Fmax = max(value._fmt.F for value in values)
 
-        return values
+        # Resize inputs (where needed) to align binary points
+        return [
+            value if value._fmt.F == Fmax else value.resize(FixFormat(value._fmt.S, value._fmt.I, Fmax))
+            for value in values
+        ]
     
     @property
     def data(self):
         """
-        Returns a copy of the internal data array.
+        Returns a copy of the internal data array, as arbitrary-precision int (dtype == object).
+        
+        Note: Narrow enough formats are stored internally as np.int64, but that is an internal detail.
+        The returned data is always arbitrary-precision, so caller arithmetic cannot overflow.
+        """
+        return self._data.astype(object)
+    
+    def data_copy(self):
+        """
+        Returns a (modifiable) copy of the internal data array. Equivalent to data.
+        """
+        return self._data.astype(object)
+    
+    def data_as_object(self):
+        """
+        Returns a copy of the internal data array as arbitrary-precision int (dtype == object).
+        Equivalent to data.
         """
-        return self._data.copy()
+        return self._data.astype(object)
     
     @property
     def fmt(self):
         """
-        Returns a copy of the fixed-point format.
+        Returns the (immutable) fixed-point format.
         """
-        return shallow_copy(self._fmt)
+        return self._fmt
     
     def to_real(self, warn=True):
         """
@@ -182,8 +300,8 @@ class WideFix:
         Includes boundes check to report possible loss of precision.
         """
         if warn:
-            if (self.fmt.S == 1 and (np.any(self.data < -2**52) or np.any(self.data >= 2**52))) \
-                or (self.fmt.S == 0 and np.any(self.data >= 2**53)):
+            if (self.fmt.S == 1 and (np.any(self._data < -2**52) or np.any(self._data >= 2**52))) \
+                or (self.fmt.S == 0 and np.any(self._data >= 2**53)):
                 warnings.warn("WideFix.to_real: Possible loss of precision when converting WideFix data to float!", Warning)
         return np.array(self._data/2.0**self._fmt.F, dtype=np.float64)
     
@@ -192,22 +310,23 @@ class WideFix:
         Packs WideFxp data into a uint64 array (e.g. for passing to MATLAB).
         Data is packed into columns, so result[:,k] corresponds to data[k].
         """
-        val = self._data
+        val = self._data.astype(object)
         fmt = self._fmt
         
         # Calculate number of uint64s needed per element
         n_ints = (fmt.width + 63) // 64  # ceil(width / 64)
 
-        # Cast to unsigned by reintepreting the sign bit
-        val = np.where(val < 0, val + 2**fmt.width, val)
+        # Cast to unsigned by reintepreting the sign bit (only negative values need modifying)
+        val[val < 0] += 2**fmt.width
 
-        # Populate 2D uint64 array
-        u64_array = np.empty((n_ints,) + val.shape, dtype='uint64')
-        for i in range(n_ints):
-            u64_array[i,:] = val % 2**64
-            val >>= 64
+        # Populate 2D uint64 array. Each int is converted to little-endian bytes in a single call,
+        # so the bytes of each element are its uint64s (least significant first).
+        n_bytes = 8*n_ints
+        buffer = b"".join([x.to_bytes(n_bytes, "little") for x in val.flat])
+        u64_array = np.frombuffer(buffer, dtype="<u8").reshape(val.shape + (n_ints,))
         
-        return u64_array
+        # Move the uint64s of each element into columns (copying into a new, modifiable array)
+        return np.moveaxis(u64_array, -1, 0).astype("uint64", order="C")
 
     def round(self, r_fmt : FixFormat, rnd : FixRound = FixRound.Trunc_s):
         """
@@ -215,89 +334,69 @@ class WideFix:
         """
         assert r_fmt == FixFormat.for_round(self._fmt, r_fmt.F, rnd), "round: Invalid result format. Use FixFormat.for_round()."
         
-        # Copy object data so self is not modified and take floor to enforce int object type
-        val = np.floor(self._data)
-        
         # Shorthands
         fmt = self._fmt
         f = fmt.F
         fr = r_fmt.F
         
-        # Add offset before truncating to implement rounding
-        if fr < f:
-            # Frac bits decrease => do rounding
-            if rnd is FixRound.Trunc_s:
-                # Truncate => Always round towards -Inf.
-                pass
-            elif rnd is FixRound.NonSymPos_s:
-                # Half-up => Round to "nearest", all ties rounded towards +Inf.
-                val = val + 2**(f - fr - 1)       # + "half"
-            elif rnd is FixRound.NonSymNeg_s:
-                # Half-down => Round to "nearest", all ties rounded towards -Inf.
-                val = val + (2**(f - fr - 1) - 1) # + "half"-delta
-            elif rnd is FixRound.SymInf_s:
-                # Half-away-from-zero => Round to "nearest", all ties rounded away from zero.
-                #                     => Half-up for val>0. Half-down for val<0.
-                offset = np.array(val < 0, dtype=int).astype(object)
-                val = val + (2**(f - fr - 1) - offset)
-            elif rnd is FixRound.SymZero_s:
-                # Half-towards-zero => Round to "nearest", all ties rounded towards zero.
-                #                   => Half-up for val<0. Half-down for val>0.
-                offset = np.array(val >= 0, dtype=int).astype(object)
-                val = val + (2**(f - fr - 1) - offset)
-            elif rnd is FixRound.ConvEven_s:
-                # Convergent-even => Round to "nearest", all ties rounded to nearest "even" number (b"X..XX0").
-                #                 => Half-down for trunc(val) even, else half-up.
-                trunc_a = val >> (f - fr)
-                trunc_a_iseven = (trunc_a + 1) % 2
-                val = val + (2**(f - fr - 1) - trunc_a_iseven*1)
-            elif rnd is FixRound.ConvOdd_s:
-                # Convergent-odd => Round to "nearest", all ties rounded to nearest "odd" number (b"X..XX1").
-                #                => Half-down for trunc(val) odd, else half-up.
-                trunc_a = val >> (f - fr)
-                trunc_a_isodd = trunc_a % 2
-                val = val + (2**(f - fr - 1) - trunc_a_isodd*1)
-            else:
-                raise Exception("resize : Illegal value for round!")
-            
-            # Truncate
-            shift = f - fr
-            val >>= shift
-        elif fr > f:
+        # Handle the cases that need no rounding offset
+        if fr > f:
             # Frac bits increase => safely scale up
-            val = val * 2**(fr - f)
-        else:
-            # Frac bits don't change => No rounding or scaling
-            pass
-            
-        return WideFix(val, r_fmt)
+            return WideFix(_as_internal(self._data, r_fmt) * 2**(fr - f), r_fmt, copy=False)
+        elif fr == f:
+            # Frac bits don't change => No rounding or scaling (read-only data can be shared)
+            return WideFix(self._data, r_fmt, copy=False)
+        elif rnd is FixRound.Trunc_s:
+            # Truncate => Always round towards -Inf.
+            return WideFix(self._data >> (f - fr), r_fmt, copy=False)
+        
+        # Frac bits decrease => do rounding.
+        # Note: self._data is never modified in-place, because the rounding offset functions always
+        # return a new array.
+        native = _fits_int64(fmt, r_fmt)
+        val = self._data.astype(np.int64 if native else object, copy=False)
+        
+        # Add offset before truncating to implement rounding
+        if rnd not in _ROUND_OFFSET:
+            raise Exception("resize : Illegal value for round!")
+        shift = f - fr
+        val = _ROUND_OFFSET[rnd](val, shift, 1 << (shift - 1))
+        
+        # Truncate
+        val >>= shift
+        
+        return WideFix(val, r_fmt, copy=False)
 
     def saturate(self, r_fmt : FixFormat, sat : FixSaturate = FixSaturate.None_s):
         """
         Returns a saturated copy (when the number of MSBs is reduced).
         """
-        # Copy object data so self is not modified and take floor to enforce int object type
-        val = np.floor(self._data)
+        # Note: self._data is never modified in-place (wrapping and clipping return a new array).
+        native = _fits_int64(self._fmt, r_fmt)
+        val = self._data.astype(np.int64 if native else object, copy=False)
+        
+        max_val = _max_int(r_fmt)
+        min_val = _min_int(r_fmt)
         
         # Saturation warning
         if sat == FixSaturate.Warn_s or sat == FixSaturate.SatWarn_s:
-            if np.any(val > WideFix.max_value(r_fmt).data) or np.any(val < WideFix.min_value(r_fmt).data):
+            if np.any(val > max_val) or np.any(val < min_val):
                 warnings.warn("resize : Saturation warning!", Warning)
         
         # Saturation
         if sat == FixSaturate.None_s or sat == FixSaturate.Warn_s:
-            # Wrap
+            # Wrap. The span is a power of 2, so modulo is done with a bitmask (two's complement &
+            # gives the non-negative remainder, like %).
             satSpan = 2**(r_fmt.I + r_fmt.F)
             if r_fmt.S == 1:
-                val = ((val + satSpan) % (2*satSpan)) - satSpan
+                val = ((val + satSpan) & (2*satSpan - 1)) - satSpan
             else:
-                val = val % satSpan
+                val = val & (satSpan - 1)
         else:
-            # Saturate
-            val = np.where(val > WideFix.max_value(r_fmt).data, WideFix.max_value(r_fmt).data, val)
-            val = np.where(val < WideFix.min_value(r_fmt).data, WideFix.min_value(r_fmt).data, val)
-            
-        return WideFix(val, r_fmt)
+            # Saturate (single pass, clamping both limits at once)
+            val = np.clip(val, min_val, max_val)
+        
+        return WideFix(val, r_fmt, copy=False)
 
     def resize(self, r_fmt : FixFormat,
                rnd : FixRound = FixRound.Trunc_s,
@@ -334,7 +433,7 @@ class WideFix:
         mid_fmt = FixFormat.for_neg(self._fmt)
         if r_fmt is None:
             r_fmt = mid_fmt
-        return WideFix(-self._data, mid_fmt, copy=False).resize(r_fmt, rnd, sat)
+        return WideFix(-_as_internal(self._data, mid_fmt), mid_fmt, copy=False).resize(r_fmt, rnd, sat)
         
     def add(self, b : "WideFix",
             r_fmt : FixFormat = None,
@@ -347,14 +446,14 @@ class WideFix:
         if r_fmt is None:
             r_fmt = mid_fmt
         
-        # Align binary points without truncating any MSBs or LSBs
-        a_round_fmt = FixFormat.for_round(a._fmt, mid_fmt.F, FixRound.Trunc_s)
-        b_round_fmt = FixFormat.for_round(b._fmt, mid_fmt.F, FixRound.Trunc_s)
-        a_round = a.round(a_round_fmt)
-        b_round = b.round(b_round_fmt)
+        # Align binary points without truncating any MSBs or LSBs (only if frac bits differ)
+        if a._fmt.F != mid_fmt.F:
+            a = a.round(FixFormat.for_round(a._fmt, mid_fmt.F, FixRound.Trunc_s))
+        if b._fmt.F != mid_fmt.F:
+            b = b.round(FixFormat.for_round(b._fmt, mid_fmt.F, FixRound.Trunc_s))
         
         # Do addition on internal integer data (binary points are aligned)
-        return WideFix(a_round._data + b_round._data, mid_fmt).resize(r_fmt, rnd, sat)
+        return WideFix(_as_internal(a._data, mid_fmt) + b._data, mid_fmt, copy=False).resize(r_fmt, rnd, sat)
 
     def sub(self, b : "WideFix",
             r_fmt : FixFormat = None,
@@ -367,14 +466,14 @@ class WideFix:
         if r_fmt is None:
             r_fmt = mid_fmt
         
-        # Align binary points without truncating any MSBs or LSBs
-        a_round_fmt = FixFormat.for_round(a._fmt, mid_fmt.F, FixRound.Trunc_s)
-        b_round_fmt = FixFormat.for_round(b._fmt, mid_fmt.F, FixRound.Trunc_s)
-        a_round = a.round(a_round_fmt)
-        b_round = b.round(b_round_fmt)
+        # Align binary points without truncating any MSBs or LSBs (only if frac bits differ)
+        if a._fmt.F != mid_fmt.F:
+            a = a.round(FixFormat.for_round(a._fmt, mid_fmt.F, FixRound.Trunc_s))
+        if b._fmt.F != mid_fmt.F:
+            b = b.round(FixFormat.for_round(b._fmt, mid_fmt.F, FixRound.Trunc_s))
         
-        # Do addition on internal integer data (binary points are aligned)
-        return WideFix(a_round._data - b_round._data, mid_fmt).resize(r_fmt, rnd, sat)
+        # Do subtraction on internal integer data (binary points are aligned)
+        return WideFix(_as_internal(a._data, mid_fmt) - b._data, mid_fmt, copy=False).resize(r_fmt, rnd, sat)
     
     def addsub(self, b : "WideFix", add,  # Bool or bool array.
                r_fmt : FixFormat = None,
@@ -401,7 +500,7 @@ class WideFix:
         mid_fmt = FixFormat.for_mult(self._fmt, b._fmt)
         if r_fmt is None:
             r_fmt = mid_fmt
-        return WideFix(self._data * b._data, mid_fmt, copy=False).resize(r_fmt, rnd, sat)
+        return WideFix(_as_internal(self._data, mid_fmt) * b._data, mid_fmt, copy=False).resize(r_fmt, rnd, sat)
 
     def shift(self, shift,
               r_fmt : FixFormat = None,
@@ -418,17 +517,18 @@ class WideFix:
         
         if np.ndim(shift) == 0:
             # Change format without changing data values => shift
-            mid = WideFix(self._data, mid_fmt)
+            mid = WideFix(self._data, mid_fmt, copy=False)
         else:
             # Variable shift (each value individually)
             assert shift.size == self._data.size, "WideFix.__lshift__: shift must be 0d or the same length as data"
-            mid = WideFix(np.zeros(self._data.size, dtype=object), mid_fmt)
+            mid_data = np.zeros(self._data.size, dtype=_internal_dtype(mid_fmt))
             for i, s in enumerate(shift):
                 # Change format without changing data values => shift
                 temp_fmt = FixFormat.for_shift(self._fmt, s)
                 temp = WideFix(self._data[i], temp_fmt, copy=False)
                 # Resize to the shared intermediate format
-                mid._data[i] = temp.resize(mid_fmt)._data[0]
+                mid_data[i] = temp.resize(mid_fmt)._data[0]
+            mid = WideFix(mid_data, mid_fmt, copy=False)
         
         return mid.resize(r_fmt, rnd, sat)
     
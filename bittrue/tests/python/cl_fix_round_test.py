@@ -43,7 +43,7 @@ def get_data(fmt : FixFormat):
     # Generate every possible value in format (counter)
     int_min = cl_fix_to_integer(cl_fix_min_value(fmt), fmt)
     int_max = cl_fix_to_integer(cl_fix_max_value(fmt), fmt)
-    int_data = np.arange(int_min, 1+int_max)
+    int_data = np.arange(int_min, 1+int_max, dtype=np.int64)
     return cl_fix_from_integer(int_data, fmt)
 
 def round_check(a, a_fmt, r_fmt, rnd):
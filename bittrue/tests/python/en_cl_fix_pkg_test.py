@@ -25,11 +25,49 @@ sys.path.append("../../models/python")
 from en_cl_fix_pkg import *
 
 import unittest
+import warnings
 
 ###################################################################################################
 # Test Cases
 ###################################################################################################
 
+### FixFormat ###
+class FixFormat_Test(unittest.TestCase):
+
+    def test_Immutable(self):
+        fmt = FixFormat(True, 3, 2)
+        for name in ["S", "I", "F"]:
+            with self.assertRaises(AttributeError):
+                setattr(fmt, name, 0)
+            with self.assertRaises(AttributeError):
+                delattr(fmt, name)
+        with self.assertRaises(AttributeError):
+            fmt.X = 0
+        self.assertEqual((1, 3, 2), (fmt.S, fmt.I, fmt.F))
+
+    def test_CachedResultsUnaffected(self):
+        # Cached result formats are shared, so failed modifications must leave them unchanged
+        fmt = FixFormat.for_add(FixFormat(True, 3, 2), FixFormat(True, 3, 2))
+        with self.assertRaises(AttributeError):
+            del fmt.S
+        self.assertEqual(FixFormat(True, 4, 2), FixFormat.for_add(FixFormat(True, 3, 2), FixFormat(True, 3, 2)))
+
+    def test_HashMatchesEq(self):
+        # Equal formats (including bool/int S) must have equal hashes
+        a = FixFormat(True, 3, 2)
+        b = FixFormat(1, 3, 2)
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(1, len({a, b}))
+        # Different formats are distinct (as dict keys)
+        fmts = [FixFormat(S, I, F) for S in (0, 1) for I in (-1, 0, 1) for F in (1, 2)]
+        self.assertEqual(len(fmts), len({fmt : None for fmt in fmts}))
+        for x in fmts:
+            for y in fmts:
+                self.assertEqual(x == y, (x.S, x.I, x.F) == (y.S, y.I, y.F))
+                if x == y:
+                    self.assertEqual(hash(x), hash(y))
+
 ### cl_fix_width ###
 class cl_fix_width_Test(unittest.TestCase):
 
@@ -78,6 +116,18 @@ class cl_fix_from_real_Test(unittest.TestCase):
         with self.assertWarns(Warning):
             cl_fix_from_real(3.9, FixFormat(False, 2, 2))
 
+    def test_Wide_NegativeRounding(self):
+        # Half-up rounding must round towards -Inf (not towards zero) for scalars and arrays
+        fmt = FixFormat(True, 60, 0)
+        self.assertEqual(-1, WideFix.from_real(-1.3, fmt).data)
+        self.assertEqual(-1, cl_fix_from_real(-1.3, fmt))
+        self.assertEqual([-1, 0, 3], list(WideFix.from_real(np.array([-1.3, -0.5, 2.5]), fmt).data))
+    
+    def test_Wide_OutOfRangeNegative(self):
+        # -8.5 rounds (half-up) to -8, but the range check is on the scaled value before rounding
+        with self.assertWarns(Warning):
+            WideFix.from_real(np.array([-8.5]), FixFormat(True, 3, 0))
+
 ### cl_fix_from_integer ###
 class cl_fix_from_integer_Test(unittest.TestCase):
 
@@ -94,6 +144,11 @@ class cl_fix_from_integer_Test(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.assertEqual(1, cl_fix_from_integer(17, FixFormat(False, 4, 0)))
 
+    def test_Wide_NativeInt(self):
+        fmt = FixFormat(True, 60, 1)
+        a = cl_fix_from_integer(np.array([3, -3], dtype=np.int64), fmt)
+        self.assertTrue(np.array_equal([1.5, -1.5], cl_fix_to_real(a, fmt)))
+
 ### cl_fix_to_integer ###
 class cl_fix_to_integer_Test(unittest.TestCase):
 
@@ -752,6 +807,124 @@ class cl_fix_Indexing_Test(unittest.TestCase):
         self.RunGetTest(fmt)
         self.RunSetTest(fmt)
         
+### WideFix (int64/arbitrary-precision boundary) ###
+class WideFix_Int64Boundary_Test(unittest.TestCase):
+    # WideFix data is np.int64 for formats up to 62 bits wide, else arbitrary-precision int. All
+    # results are compared against plain Python int arithmetic.
+    
+    def ExtremeData(self, fmt):
+        # Min/max values, values around zero, and ties/near-ties for rounding
+        lo = -2**(fmt.I+fmt.F) if fmt.S == 1 else 0
+        hi = 2**(fmt.I+fmt.F) - 1
+        values = [lo, lo+1, lo+2, -3, -2, -1, 0, 1, 2, 3, hi-2, hi-1, hi]
+        return [x for x in values if lo <= x <= hi]
+    
+    def RoundReference(self, x, shift, rnd):
+        q, r = divmod(x, 2**shift)  # Floor division
+        half = 2**(shift-1)
+        if rnd is FixRound.Trunc_s or r < half:
+            return q
+        if r > half:
+            return q+1
+        # Tie
+        round_up = {
+            FixRound.NonSymPos_s : True,
+            FixRound.NonSymNeg_s : False,
+            FixRound.SymInf_s    : x > 0,
+            FixRound.SymZero_s   : x < 0,
+            FixRound.ConvEven_s  : q % 2 == 1,
+            FixRound.ConvOdd_s   : q % 2 == 0,
+        }[rnd]
+        return q+1 if round_up else q
+    
+    def CheckData(self, r, expected):
+        # data and data_as_object() always return arbitrary-precision ints
+        for data in [r.data, r.data_as_object()]:
+            self.assertEqual(object, data.dtype)
+            self.assertEqual(expected, list(data))
+        # Internal data is np.int64 only if the result format fits
+        self.assertEqual(np.int64 if r.fmt.width <= 62 else object, r._data.dtype)
+    
+    def test_Data_NoOverflow(self):
+        # Caller arithmetic on data must not overflow, even if the data is stored as np.int64
+        a = WideFix(np.array([2**60-1], dtype=object), FixFormat(0, 60, 0))
+        self.assertEqual([(2**60-1)*16], list(a.data * 16))
+    
+    def test_Round_AllModes(self):
+        # Rounding offsets need 1 more int bit, so these are 61-bit formats (np.int64 offset path)
+        # as well as 62-bit and 63-bit formats (arbitrary-precision offset path)
+        for a_fmt in [FixFormat(1, 40, 20), FixFormat(1, 40, 21), FixFormat(1, 40, 22),
+                      FixFormat(0, 41, 20), FixFormat(0, 41, 21), FixFormat(0, 41, 22)]:
+            self.assertIn(a_fmt.width, (61, 62, 63))
+            data = self.ExtremeData(a_fmt)
+            # Ties and near-ties for a 4-bit shift
+            data += [x for x in (-25, -24, -23, -9, -8, -7, 7, 8, 9, 23, 24, 25) if x in range(min(data), max(data)+1)]
+            a = WideFix(np.array(data, dtype=object), a_fmt)
+            for shift in [1, 4, 21]:
+                for rnd in FixRound:
+                    r_fmt = FixFormat.for_round(a_fmt, a_fmt.F - shift, rnd)
+                    r = a.round(r_fmt, rnd)
+                    self.CheckData(r, [self.RoundReference(x, shift, rnd) for x in data])
+    
+    def test_Round_Trunc_LargeShift(self):
+        # Shift by >= 64 bits (on np.int64 data for the 62-bit format)
+        for a_fmt in [FixFormat(1, -8, 69), FixFormat(1, -8, 70)]:
+            self.assertIn(a_fmt.width, (62, 63))
+            data = self.ExtremeData(a_fmt)
+            a = WideFix(np.array(data, dtype=object), a_fmt)
+            for shift in [64, 69]:
+                r_fmt = FixFormat.for_round(a_fmt, a_fmt.F - shift, FixRound.Trunc_s)
+                r = a.round(r_fmt, FixRound.Trunc_s)
+                self.CheckData(r, [x >> shift for x in data])
+    
+    def test_Saturate_WrapAndClamp(self):
+        for a_fmt in [FixFormat(1, 40, 21), FixFormat(1, 40, 22), FixFormat(0, 41, 21), FixFormat(0, 41, 22)]:
+            self.assertIn(a_fmt.width, (62, 63))
+            data = self.ExtremeData(a_fmt)
+            a = WideFix(np.array(data, dtype=object), a_fmt)
+            for r_fmt in [FixFormat(a_fmt.S, a_fmt.I-1, a_fmt.F), FixFormat(a_fmt.S, 3, a_fmt.F)]:
+                lo = -2**(r_fmt.I+r_fmt.F) if r_fmt.S == 1 else 0
+                span = 2**(r_fmt.S+r_fmt.I+r_fmt.F)
+                # Wrap
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    r = a.saturate(r_fmt, FixSaturate.Warn_s)
+                self.CheckData(r, [(x - lo) % span + lo for x in data])
+                # Clamp
+                r = a.saturate(r_fmt, FixSaturate.Sat_s)
+                self.CheckData(r, [min(max(x, lo), lo+span-1) for x in data])
+    
+    def test_Add_GrowsPast62Bits(self):
+        # 61+61 bits -> 62 bits (np.int64), 62+62 bits -> 63 bits (arbitrary-precision)
+        for fmt in [FixFormat(1, 30, 30), FixFormat(1, 30, 31), FixFormat(0, 31, 30), FixFormat(0, 31, 31)]:
+            data = self.ExtremeData(fmt)
+            a = WideFix(np.array(data, dtype=object), fmt)
+            b = WideFix(np.array(data[::-1], dtype=object), fmt)
+            r = a + b
+            self.assertEqual(FixFormat.for_add(fmt, fmt), r.fmt)
+            self.assertIn(r.fmt.width, (62, 63))
+            self.CheckData(r, [x + y for x, y in zip(data, data[::-1])])
+            # Extremes added to themselves
+            r = a + a
+            self.CheckData(r, [2*x for x in data])
+    
+    def test_Mult_GrowsPast62Bits(self):
+        # Result formats of 62 bits (np.int64) and 63 bits (arbitrary-precision), and products of
+        # 62-bit (np.int64) inputs, which would overflow in np.int64
+        for a_fmt, b_fmt in [(FixFormat(1, 30, 0), FixFormat(1, 30, 0)),
+                             (FixFormat(1, 30, 1), FixFormat(1, 30, 0)),
+                             (FixFormat(0, 31, 0), FixFormat(0, 31, 0)),
+                             (FixFormat(0, 31, 1), FixFormat(0, 31, 0)),
+                             (FixFormat(1, 40, 21), FixFormat(1, 40, 21)),
+                             (FixFormat(0, 41, 21), FixFormat(1, 40, 21))]:
+            a_data = self.ExtremeData(a_fmt)
+            b_data = self.ExtremeData(b_fmt)
+            a = WideFix(np.array([x for x in a_data for _ in b_data], dtype=object), a_fmt)
+            b = WideFix(np.array([y for _ in a_data for y in b_data], dtype=object), b_fmt)
+            r = a * b
+            self.assertEqual(FixFormat.for_mult(a_fmt, b_fmt), r.fmt)
+            self.CheckData(r, [x * y for x in a_data for y in b_data])
+
 ###################################################################################################
 # Test Runner
 ###################################################################################################
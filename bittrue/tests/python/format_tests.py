@@ -22,6 +22,9 @@
 #
 # This script checks the FixFormat.For* functions to ensure they all provide optimal (sufficient
 # and necessary) formats.
+#
+# The format checks always run. The sanity checks of the test calculations themselves are plain
+# asserts, so they can be skipped for a faster run with: python -O format_tests.py
 ###################################################################################################
 
 ###################################################################################################
@@ -35,6 +38,8 @@ sys.path.append(join(root, "../../models/python"))
 from en_cl_fix_pkg import *
 
 import numpy as np
+import random
+from functools import reduce
 
 ###################################################################################################
 # Config
@@ -42,17 +47,223 @@ import numpy as np
 
 # a_fmt test points
 aS_values = [0,1]
-aI_values = np.arange(-6,1+6)
-aF_values = np.arange(-6,1+6)
+aI_values = range(-6,1+6)
+aF_values = range(-6,1+6)
 
 # b_fmt test points
 bS_values = [0,1]
-bI_values = np.arange(-6,1+6)
-bF_values = np.arange(-6,1+6)
+bI_values = range(-6,1+6)
+bF_values = range(-6,1+6)
 
 # shift test points
-min_shift_values = np.arange(-4,1+4)
-shift_range_values = np.arange(5)
+min_shift_values = range(-4,1+4)
+shift_range_values = range(5)
+
+# Randomly sampled wide formats (in addition to the dense grid of test points above). Their min/max
+# values are not exact as floats, so they are checked in exact integer arithmetic.
+random_seed = 0
+random_test_count = 2000
+random_I_values = range(-32,1+32)
+random_F_values = range(-32,1+32)
+
+###################################################################################################
+# Helper Functions
+###################################################################################################
+
+def fmt_arrays(fmts):
+    """
+    Converts a list of FixFormats into arrays of S, I and F.
+    """
+    return tuple(np.array([getattr(fmt, x) for fmt in fmts]) for x in "SIF")
+
+def int_max_value(fmt, K):
+    """
+    Returns cl_fix_max_value(fmt) exactly, as an integer number of LSBs of weight 2**-K (K >= fmt.F).
+    """
+    return ((1 << (fmt.I + fmt.F)) - 1) << (K - fmt.F)
+
+def int_min_value(fmt, K):
+    """
+    Returns cl_fix_min_value(fmt) exactly, as an integer number of LSBs of weight 2**-K (K >= fmt.F).
+    """
+    return -(1 << (fmt.I + fmt.F)) << (K - fmt.F) if fmt.S == 1 else 0
+
+# Min/max values of all formats that can occur in the tests, indexed by [S, I, F] (offset by
+# TABLE_MIN). They are calculated at once from the closed forms of cl_fix_min_value/cl_fix_max_value
+# (-S*2**I and 2**I - 2**-F). Invalid formats (I+F < 0) are NaN, so any comparison with them fails.
+TABLE_MIN = -16
+TABLE_MAX = 16
+S_GRID, I_GRID, F_GRID = np.meshgrid(range(2), range(TABLE_MIN, TABLE_MAX+1), range(TABLE_MIN, TABLE_MAX+1), indexing="ij")
+VALID_GRID = (I_GRID + F_GRID >= 0)
+MIN_TABLE = np.where(VALID_GRID, -S_GRID * 2.0**I_GRID, np.nan)
+MAX_TABLE = np.where(VALID_GRID, 2.0**I_GRID - 2.0**-F_GRID, np.nan)
+# Sanity checks (against cl_fix_min_value/cl_fix_max_value and the exact integer helpers)
+if __debug__:
+    for S, I, F in zip(S_GRID[VALID_GRID], I_GRID[VALID_GRID], F_GRID[VALID_GRID]):
+        fmt = FixFormat(int(S), int(I), int(F))
+        assert MIN_TABLE[S, I-TABLE_MIN, F-TABLE_MIN] == cl_fix_min_value(fmt) == int_min_value(fmt, fmt.F) * 2.0**-fmt.F
+        assert MAX_TABLE[S, I-TABLE_MIN, F-TABLE_MIN] == cl_fix_max_value(fmt) == int_max_value(fmt, fmt.F) * 2.0**-fmt.F
+
+def table_index(S, I, F):
+    """
+    Returns the min/max table index for (scalars or arrays of) S, I and F.
+    """
+    # Not an assert: out-of-range (e.g. negative) indices must never silently wrap around
+    if not np.all((TABLE_MIN <= I) & (I <= TABLE_MAX)):
+        raise AssertionError("Number of int bits is outside of the min/max table")
+    if not np.all((TABLE_MIN <= F) & (F <= TABLE_MAX)):
+        raise AssertionError("Number of frac bits is outside of the min/max table")
+    return S, I-TABLE_MIN, F-TABLE_MIN
+
+def min_values(S, I, F):
+    """
+    Looks up cl_fix_min_value(FixFormat(S, I, F)), for scalars or arrays of S, I and F.
+    """
+    return MIN_TABLE[table_index(S, I, F)]
+
+def max_values(S, I, F):
+    """
+    Looks up cl_fix_max_value(FixFormat(S, I, F)), for scalars or arrays of S, I and F.
+    """
+    return MAX_TABLE[table_index(S, I, F)]
+
+def max_of(*values):
+    """
+    Elementwise max of scalars or arrays (without stacking them into a new array, like np.amax).
+    """
+    return reduce(np.maximum, values)
+
+def min_of(*values):
+    """
+    Elementwise min of scalars or arrays (without stacking them into a new array, like np.amin).
+    """
+    return reduce(np.minimum, values)
+
+def int_bits_necessary(S, I, F, rmax, rmin):
+    """
+    Returns True where 1 less int bit than FixFormat(S, I, F) would not be sufficient for the range
+    [rmin, rmax], for scalars or arrays. No format with 1 less int bit is constructed.
+    """
+    bound = 2.0**(I - 1)
+    return (rmax > bound - 2.0**-F) | (rmin < -S*bound)
+
+def check_formats(name, r_fmts, rmax, rmin, expected_F, describe):
+    """
+    Checks an array of result formats at once: int bits must be sufficient and necessary, and the
+    number of frac bits must be expected_F.
+    
+    If a check fails, then the first failing test is reported, using describe(index) to describe
+    its input formats.
+    """
+    rS, rI, rF = fmt_arrays(r_fmts)
+    checks = [
+        (rmax <= max_values(rS, rI, rF), "Max value exceeded"),
+        (rmin >= min_values(rS, rI, rF), "Min value exceeded"),
+        # Int bits are necessary if 1 less int bit would not be sufficient (or would not be a valid
+        # format, I+F < 0)
+        ((rI + rF <= 0) | int_bits_necessary(rS, rI, rF, rmax, rmin),
+            "Format is excessively wide."),
+        (rF == expected_F, "Unexpected number of frac bits"),
+    ]
+    for passed, message in checks:
+        if not np.all(passed):
+            i = np.argmin(passed)
+            raise AssertionError(f"{name}: {message}"
+                + f" {describe(i)}, r_fmt: {r_fmts[i]}, rmax: {rmax[i]}, rmin: {rmin[i]}")
+
+def check_unary_op(name, a_fmts, r_fmts, rmax, rmin, expected_F):
+    """
+    Checks the result formats of a unary operation, for all a_fmts at once.
+    """
+    check_formats(name, r_fmts, rmax, rmin, expected_F,
+                  describe=lambda i: f"a_fmt: {a_fmts[i]}")
+
+def check_binary_op(name, a_fmt, b_fmts, r_fmts, rmax, rmin, expected_F):
+    """
+    Checks the result formats of a binary operation, for one a_fmt and all b_fmts at once.
+    """
+    check_formats(name, r_fmts, rmax, rmin, expected_F,
+                  describe=lambda i: f"a_fmt: {a_fmt}, b_fmt: {b_fmts[i]}")
+
+def binary_op_fmts(a_fmt, b_fmts):
+    """
+    Returns the add, sub, addsub and mult result formats for a_fmt and each of b_fmts (as 4
+    sequences), in a single pass over b_fmts.
+    """
+    for_add, for_sub, for_addsub, for_mult = FixFormat.for_add, FixFormat.for_sub, FixFormat.for_addsub, FixFormat.for_mult
+    return zip(*[
+        (for_add(a_fmt, b_fmt), for_sub(a_fmt, b_fmt), for_addsub(a_fmt, b_fmt), for_mult(a_fmt, b_fmt))
+        for b_fmt in b_fmts
+    ])
+
+def check_format_exact(name, r_fmt, rmax, rmin, K, expected_F, describe):
+    """
+    Checks a single result format like check_formats, but exactly: rmax and rmin are integer
+    numbers of LSBs of weight 2**-K.
+    """
+    # Rescale if r_fmt has more frac bits than expected (the frac bits check reports this)
+    if r_fmt.F > K:
+        rmax <<= r_fmt.F - K
+        rmin <<= r_fmt.F - K
+        K = r_fmt.F
+    message = None
+    if rmax > int_max_value(r_fmt, K):
+        message = "Max value exceeded"
+    elif rmin < int_min_value(r_fmt, K):
+        message = "Min value exceeded"
+    elif r_fmt.I + r_fmt.F > 0:
+        # Int bits are necessary if 1 less int bit would not be sufficient
+        bound = 1 << (r_fmt.I - 1 + K)
+        if not (rmax > bound - (1 << (K - r_fmt.F)) or rmin < -r_fmt.S * bound):
+            message = "Format is excessively wide."
+    if message is None and r_fmt.F != expected_F:
+        message = "Unexpected number of frac bits"
+    if message is not None:
+        raise AssertionError(f"{name}: {message}"
+            + f" {describe()}, r_fmt: {r_fmt}, rmax: {rmax * 2.0**-K}, rmin: {rmin * 2.0**-K}")
+
+def random_fmt(rng):
+    """
+    Returns a random (usable) FixFormat, with I and F from random_I_values and random_F_values.
+    """
+    while True:
+        S, I, F = rng.choice(bS_values), rng.choice(random_I_values), rng.choice(random_F_values)
+        if S+I+F >= 1:
+            return FixFormat(S, I, F)
+
+def check_random_fmts(seed, count):
+    """
+    Checks the unary and binary operations for count randomly sampled (a_fmt, b_fmt) pairs.
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        a_fmt = random_fmt(rng)
+        b_fmt = random_fmt(rng)
+        describe = lambda: f"a_fmt: {a_fmt}, b_fmt: {b_fmt}"
+        
+        # Extreme input values, as integer numbers of LSBs of weight 2**-K
+        K = max(a_fmt.F, b_fmt.F)
+        a_ext = (int_min_value(a_fmt, K), int_max_value(a_fmt, K))
+        b_ext = (int_min_value(b_fmt, K), int_max_value(b_fmt, K))
+        
+        # Unary operations. The optimal number of frac bits is trivial: a_fmt.F
+        a_ext_aF = [x >> (K - a_fmt.F) for x in a_ext]
+        neg = [-a for a in a_ext_aF]
+        check_format_exact("neg", FixFormat.for_neg(a_fmt), max(neg), min(neg), a_fmt.F, a_fmt.F, describe)
+        abs_ = neg + a_ext_aF
+        check_format_exact("abs", FixFormat.for_abs(a_fmt), max(abs_), min(abs_), a_fmt.F, a_fmt.F, describe)
+        
+        # Binary operations. The extremes are taken over all combinations of extreme inputs.
+        add = [a + b for a in a_ext for b in b_ext]
+        sub = [a - b for a in a_ext for b in b_ext]
+        mult = [a * b for a in a_ext for b in b_ext]  # LSB weight 2**-2K
+        check_format_exact("add", FixFormat.for_add(a_fmt, b_fmt), max(add), min(add), K, K, describe)
+        check_format_exact("sub", FixFormat.for_sub(a_fmt, b_fmt), max(sub), min(sub), K, K, describe)
+        check_format_exact("addsub", FixFormat.for_addsub(a_fmt, b_fmt), max(add + sub), min(add + sub), K, K, describe)
+        # Mult LSBs are reduced to weight 2**-(a_fmt.F + b_fmt.F) (the expected number of frac bits)
+        sum_F = a_fmt.F + b_fmt.F
+        check_format_exact("mult", FixFormat.for_mult(a_fmt, b_fmt), max(mult) >> (2*K - sum_F), min(mult) >> (2*K - sum_F),
+                           sum_F, sum_F, describe)
 
 ###################################################################################################
 # Run
@@ -64,253 +275,252 @@ test_r_fmt = []
 test_rnd = []
 test_sat = []
 
+#########
+# b_fmt #
+#########
+
+# The b_fmt loop is vectorized: each a_fmt is tested against all (usable) b_fmts at once.
+b_fmts = [
+    FixFormat(bS, bI, bF)
+    for bS in bS_values for bI in bI_values for bF in bF_values
+    if bS+bI+bF >= 1  # Skip unusable formats
+]
+bS, bI, bF = fmt_arrays(b_fmts)
+
+bmin = min_values(bS, bI, bF)
+bmax = max_values(bS, bI, bF)
+
 #########
 # a_fmt #
 #########
-for aS in aS_values:
-    for aI in aI_values:
-        for aF in aF_values:
-            # Skip unusable formats
-            if aS+aI+aF < 1:
-                continue
-            
-            a_fmt = FixFormat(aS, aI, aF)
-            
-            amin = cl_fix_min_value(a_fmt)
-            amax = cl_fix_max_value(a_fmt)
-            
-            #########
-            # b_fmt #
-            #########
-            for bS in bS_values:
-                for bI in bI_values:
-                    for bF in bF_values:
-                        # Skip unusable formats
-                        if bS+bI+bF < 1:
-                            continue
-                        
-                        b_fmt = FixFormat(bS, bI, bF)
-                        
-                        bmin = cl_fix_min_value(b_fmt)
-                        bmax = cl_fix_max_value(b_fmt)
-                        
-                        ##############
-                        # cl_fix_add #
-                        ##############
-                        
-                        # Calculate the extreme results
-                        rmax = amax + bmax
-                        rmin = amin + bmin
-                        # Sanity checks
-                        assert rmax == np.amax([amin + bmin, amin + bmax, amax + bmin, amax + bmax])
-                        assert rmin == np.amin([amin + bmin, amin + bmax, amax + bmin, amax + bmax])
-                        
-                        # Format to test
-                        r_fmt = FixFormat.for_add(a_fmt, b_fmt)
-                        
-                        # Check int bits are sufficient
-                        assert rmax <= cl_fix_max_value(r_fmt), "add: Max value exceeded" \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        assert rmin >= cl_fix_min_value(r_fmt), "add: Min value exceeded" \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        
-                        # Check int bits are necessary
-                        smaller_fmt = FixFormat(r_fmt.S, r_fmt.I - 1, r_fmt.F)
-                        assert rmax > cl_fix_max_value(smaller_fmt) or rmin < cl_fix_min_value(smaller_fmt), "add: Format is excessively wide." \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        
-                        # The optimal number of frac bits is trivial: max(a_fmt.F, b_fmt.F)
-                        assert r_fmt.F == max(a_fmt.F, b_fmt.F), "add: Unexpected number of frac bits"
-                        
-                        ##############
-                        # cl_fix_sub #
-                        ##############
-                        
-                        # Calculate the extreme results
-                        rmax = amax - bmin
-                        rmin = amin - bmax
-                        # Sanity checks
-                        assert rmax == np.amax([amin - bmin, amin - bmax, amax - bmin, amax - bmax])
-                        assert rmin == np.amin([amin - bmin, amin - bmax, amax - bmin, amax - bmax])
-                        
-                        # Format to test
-                        r_fmt = FixFormat.for_sub(a_fmt, b_fmt)
-                        
-                        # Check int bits are sufficient
-                        assert rmax <= cl_fix_max_value(r_fmt), "sub: Max value exceeded" \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        assert rmin >= cl_fix_min_value(r_fmt), "sub: Min value exceeded" \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        
-                        # Check int bits are necessary
-                        smaller_fmt = FixFormat(r_fmt.S, r_fmt.I - 1, r_fmt.F)
-                        assert rmax > cl_fix_max_value(smaller_fmt) or rmin < cl_fix_min_value(smaller_fmt), "sub: Format is excessively wide." \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        
-                        # The optimal number of frac bits is trivial: max(a_fmt.F, b_fmt.F)
-                        assert r_fmt.F == max(a_fmt.F, b_fmt.F), "sub: Unexpected number of frac bits"
-                        
-                        #################
-                        # cl_fix_addsub #
-                        #################
-                        
-                        # Calculate the extreme results
-                        rmax = max(amax + bmax, amax - bmin)
-                        rmin = min(amin + bmin, amin - bmax)
-                        # Sanity checks
-                        assert rmax == np.amax([amin + bmin, amin + bmax, amax + bmin, amax + bmax, amin - bmin, amin - bmax, amax - bmin, amax - bmax])
-                        assert rmin == np.amin([amin + bmin, amin + bmax, amax + bmin, amax + bmax, amin - bmin, amin - bmax, amax - bmin, amax - bmax])
-                        
-                        # Format to test
-                        r_fmt = FixFormat.for_addsub(a_fmt, b_fmt)
-                        
-                        # Check int bits are sufficient
-                        assert rmax <= cl_fix_max_value(r_fmt), "addsub: Max value exceeded" \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        assert rmin >= cl_fix_min_value(r_fmt), "addsub: Min value exceeded" \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        
-                        # Check int bits are necessary
-                        smaller_fmt = FixFormat(r_fmt.S, r_fmt.I - 1, r_fmt.F)
-                        assert rmax > cl_fix_max_value(smaller_fmt) or rmin < cl_fix_min_value(smaller_fmt), "addsub: Format is excessively wide." \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        
-                        # The optimal number of frac bits is trivial: max(a_fmt.F, b_fmt.F)
-                        assert r_fmt.F == max(a_fmt.F, b_fmt.F), "addsub: Unexpected number of frac bits"
-                        
-                        ###############
-                        # cl_fix_mult #
-                        ###############
-                        
-                        # Calculate the max result
-                        if a_fmt.S == 1 and b_fmt.S == 1:
-                            rmax = amin * bmin  # -max*-max = +max
-                        else:
-                            rmax = amax * bmax
-                        # Sanity check
-                        assert rmax == np.amax([amin * bmin, amin * bmax, amax * bmin, amax * bmax])
-                        
-                        # Calculate the min result
-                        if a_fmt.S == 0 and b_fmt.S == 0:
-                            rmin = amin * bmin
-                        elif a_fmt.S == 0 and b_fmt.S == 1:
-                            rmin = amax * bmin
-                        elif a_fmt.S == 1 and b_fmt.S == 0:
-                            rmin = amin * bmax
-                        elif a_fmt.S == 1 and b_fmt.S == 1:
-                            rmin = min(amax * bmin, amin * bmax)
-                        # Sanity check
-                        assert rmin == np.amin([amin * bmin, amin * bmax, amax * bmin, amax * bmax])
-                        
-                        # Format to test
-                        r_fmt = FixFormat.for_mult(a_fmt, b_fmt)
-                        
-                        # Check int bits are sufficient
-                        assert rmax <= cl_fix_max_value(r_fmt), "mult: Max value exceeded" \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        assert rmin >= cl_fix_min_value(r_fmt), "mult: Min value exceeded" \
-                            + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        
-                        # Check int bits are necessary
-                        if r_fmt.I + r_fmt.F > 0:
-                            smaller_fmt = FixFormat(r_fmt.S, r_fmt.I - 1, r_fmt.F)
-                            assert rmax > cl_fix_max_value(smaller_fmt) or rmin < cl_fix_min_value(smaller_fmt), "mult: Format is excessively wide." \
-                                + f" a_fmt: {a_fmt}, b_fmt: {b_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                        
-                        # The optimal number of frac bits is straightforward: a_fmt.F + b_fmt.F. For example,
-                        # if we take +/- 1 LSB in each representation: (+/- 2**-a_fmt.F) * (+/- 2**-b_fmt.F)
-                        # = +/- 2**-(a_fmt.F + b_fmt.F). No other inputs could need more frac bits.
-                        assert r_fmt.F == a_fmt.F + b_fmt.F, "mult: Unexpected number of frac bits"
-                    
-            ##############
-            # cl_fix_neg #
-            ##############
-            
-            # Calculate the extreme results
-            rmax = -amin
-            rmin = -amax
-            # Sanity checks
-            assert rmax == np.amax([-amax, -amin])
-            assert rmin == np.amin([-amax, -amin])
-            
-            # Format to test
-            r_fmt = FixFormat.for_neg(a_fmt)
-            
-            # Check int bits are sufficient
-            assert rmax <= cl_fix_max_value(r_fmt), "neg: Max value exceeded" \
-                + f" a_fmt: {a_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-            assert rmin >= cl_fix_min_value(r_fmt), "neg: Min value exceeded" \
-                + f" a_fmt: {a_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-            
-            # Check int bits are necessary
-            if r_fmt.I + r_fmt.F > 0:
-                smaller_fmt = FixFormat(r_fmt.S, r_fmt.I - 1, r_fmt.F)
-                assert rmax > cl_fix_max_value(smaller_fmt) or rmin < cl_fix_min_value(smaller_fmt), "neg: Format is excessively wide." \
-                    + f" a_fmt: {a_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-            
-            # The optimal number of frac bits is trivial: a_fmt.F
-            assert r_fmt.F == a_fmt.F, "neg: Unexpected number of frac bits"
-            
-            ##############
-            # cl_fix_abs #
-            ##############
-            
-            # Calculate the extreme results
-            rmax = max(amax, -amin)
-            rmin = min(amin, -amax)
-            # Sanity checks
-            assert rmax == np.amax([amax, amin, -amax, -amin])
-            assert rmin == np.amin([amax, amin, -amax, -amin])
-            
-            # Format to test
-            r_fmt = FixFormat.for_abs(a_fmt)
-            
-            # Check int bits are sufficient
-            assert rmax <= cl_fix_max_value(r_fmt), "abs: Max value exceeded" \
-                + f" a_fmt: {a_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-            assert rmin >= cl_fix_min_value(r_fmt), "abs: Min value exceeded" \
-                + f" a_fmt: {a_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-            
-            # Check int bits are necessary
-            smaller_fmt = FixFormat(r_fmt.S, r_fmt.I - 1, r_fmt.F)
-            assert rmax > cl_fix_max_value(smaller_fmt) or rmin < cl_fix_min_value(smaller_fmt), "abs: Format is excessively wide." \
-                + f" a_fmt: {a_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-            
-            # The optimal number of frac bits is trivial: a_fmt.F
-            assert r_fmt.F == a_fmt.F, "abs: Unexpected number of frac bits"
-            
-            ################
-            # cl_fix_shift #
-            ################
-            for min_shift in min_shift_values:
-                for shift_range in shift_range_values:
-                    max_shift = min_shift + shift_range
-                    
-                    # Calculate the extreme results
-                    rmax = amax * 2.0**max_shift
-                    if amin < 0:
-                        rmin = amin * 2.0**max_shift
-                    else:
-                        rmin = amin * 2.0**min_shift
-                    # Sanity checks
-                    assert rmax == np.amax([amax * 2.0**max_shift, amax * 2.0**min_shift, amin * 2.0**max_shift, amin * 2.0**min_shift])
-                    assert rmin == np.amin([amax * 2.0**max_shift, amax * 2.0**min_shift, amin * 2.0**max_shift, amin * 2.0**min_shift])
-                    
-                    # Format to test
-                    r_fmt = FixFormat.for_shift(a_fmt, min_shift, max_shift)
-                    
-                    # Check int bits are sufficient
-                    assert rmax <= cl_fix_max_value(r_fmt), "shift: Max value exceeded" \
-                        + f" a_fmt: {a_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                    assert rmin >= cl_fix_min_value(r_fmt), "shift: Min value exceeded" \
-                        + f" a_fmt: {a_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}"
-                    
-                    # Check int bits are necessary
-                    if r_fmt.I + r_fmt.F > 0:
-                        smaller_fmt = FixFormat(r_fmt.S, r_fmt.I - 1, r_fmt.F)
-                        assert rmax > cl_fix_max_value(smaller_fmt) or rmin < cl_fix_min_value(smaller_fmt), "shift: Format is excessively wide." \
-                            + f" a_fmt: {a_fmt}, r_fmt: {r_fmt}, rmax: {rmax}, rmin: {rmin}, min_shift: {min_shift}, max_shift: {max_shift}"
-                    
-                    # The optimal number of frac bits is trivial: a_fmt.F - min_shift
-                    assert r_fmt.F == a_fmt.F - min_shift, "shift: Unexpected number of frac bits"
-                    
\ No newline at end of file
+
+# Unary operations are vectorized: all (usable) a_fmts are tested at once.
+a_fmts = [
+    FixFormat(aS, aI, aF)
+    for aS in aS_values for aI in aI_values for aF in aF_values
+    if aS+aI+aF >= 1  # Skip unusable formats
+]
+a_S, a_I, a_F = fmt_arrays(a_fmts)
+amins = min_values(a_S, a_I, a_F)
+amaxs = max_values(a_S, a_I, a_F)
+
+#########
+# shift #
+#########
+
+# The shift loops are vectorized: each a_fmt is tested with all (min_shift, max_shift) pairs at once.
+shift_pairs = [
+    (min_shift, min_shift + shift_range)
+    for min_shift in min_shift_values for shift_range in shift_range_values
+]
+min_shifts = np.array([min_shift for min_shift, _ in shift_pairs])
+max_shifts = np.array([max_shift for _, max_shift in shift_pairs])
+
+###########################################
+# Binary operations and shift (per a_fmt) #
+###########################################
+
+# Each a_fmt is tested against all b_fmts. a_fmt min/max values come from the a_fmt table.
+def check_a_fmt(a_fmt, amin, amax):
+    
+    # Formats to test (for all b_fmts)
+    add_fmts, sub_fmts, addsub_fmts, mult_fmts = binary_op_fmts(a_fmt, b_fmts)
+    
+    # Expected numbers of frac bits (for all b_fmts), shared by several operations
+    max_F = np.maximum(a_fmt.F, bF)  # add, sub, addsub
+    sum_F = a_fmt.F + bF  # mult
+    
+    # The extreme results of all binary operations are calculated first (sharing amin/amax and
+    # bmin/bmax), and then checked in a single pass
+    ops = []
+    
+    ##############
+    # cl_fix_add #
+    ##############
+    
+    # Calculate the extreme results
+    rmax = amax + bmax
+    rmin = amin + bmin
+    # Sanity checks
+    assert np.all(rmax == max_of(amin + bmin, amin + bmax, amax + bmin, amax + bmax))
+    assert np.all(rmin == min_of(amin + bmin, amin + bmax, amax + bmin, amax + bmax))
+    
+    # The optimal number of frac bits is trivial: max(a_fmt.F, b_fmt.F)
+    ops.append(("add", add_fmts, rmax, rmin, max_F))
+    
+    ##############
+    # cl_fix_sub #
+    ##############
+    
+    # Calculate the extreme results
+    rmax = amax - bmin
+    rmin = amin - bmax
+    # Sanity checks
+    assert np.all(rmax == max_of(amin - bmin, amin - bmax, amax - bmin, amax - bmax))
+    assert np.all(rmin == min_of(amin - bmin, amin - bmax, amax - bmin, amax - bmax))
+    
+    # The optimal number of frac bits is trivial: max(a_fmt.F, b_fmt.F)
+    ops.append(("sub", sub_fmts, rmax, rmin, max_F))
+    
+    #################
+    # cl_fix_addsub #
+    #################
+    
+    # Calculate the extreme results
+    rmax = np.maximum(amax + bmax, amax - bmin)
+    rmin = np.minimum(amin + bmin, amin - bmax)
+    # Sanity checks
+    assert np.all(rmax == max_of(amin + bmin, amin + bmax, amax + bmin, amax + bmax, amin - bmin, amin - bmax, amax - bmin, amax - bmax))
+    assert np.all(rmin == min_of(amin + bmin, amin + bmax, amax + bmin, amax + bmax, amin - bmin, amin - bmax, amax - bmin, amax - bmax))
+    
+    # The optimal number of frac bits is trivial: max(a_fmt.F, b_fmt.F)
+    ops.append(("addsub", addsub_fmts, rmax, rmin, max_F))
+    
+    ###############
+    # cl_fix_mult #
+    ###############
+    
+    # The extreme results depend only on the signedness of the inputs, so they are looked up in a
+    # table of the 4 cases, indexed by 2*a_fmt.S + b_fmt.S
+    mult_case = 2*a_fmt.S + bS
+    
+    # Calculate the max result
+    rmax = np.choose(mult_case, [
+        amax * bmax,
+        amax * bmax,
+        amax * bmax,
+        amin * bmin,  # -max*-max = +max
+    ])
+    # Sanity check
+    assert np.all(rmax == max_of(amin * bmin, amin * bmax, amax * bmin, amax * bmax))
+    
+    # Calculate the min result
+    rmin = np.choose(mult_case, [
+        amin * bmin,
+        amax * bmin,
+        amin * bmax,
+        np.minimum(amax * bmin, amin * bmax),
+    ])
+    # Sanity check
+    assert np.all(rmin == min_of(amin * bmin, amin * bmax, amax * bmin, amax * bmax))
+    
+    # The optimal number of frac bits is straightforward: a_fmt.F + b_fmt.F. For example, if we
+    # take +/- 1 LSB in each representation: (+/- 2**-a_fmt.F) * (+/- 2**-b_fmt.F)
+    # = +/- 2**-(a_fmt.F + b_fmt.F). No other inputs could need more frac bits.
+    ops.append(("mult", mult_fmts, rmax, rmin, sum_F))
+    
+    ###############################
+    # Check all binary operations #
+    ###############################
+    
+    for name, r_fmts, rmax, rmin, expected_F in ops:
+        check_binary_op(name, a_fmt, b_fmts, r_fmts, rmax, rmin, expected_F)
+    
+    ################
+    # cl_fix_shift #
+    ################
+    
+    # Shifted values are calculated exactly, in integer arithmetic (no float scaling by 2.0**shift).
+    # All (min_shift, max_shift) pairs are tested at once.
+    amax_int = int_max_value(a_fmt, a_fmt.F)
+    amin_int = int_min_value(a_fmt, a_fmt.F)
+    
+    # Formats to test
+    r_fmts = [FixFormat.for_shift(a_fmt, min_shift, max_shift) for min_shift, max_shift in shift_pairs]
+    rF = np.array([r_fmt.F for r_fmt in r_fmts])
+    
+    # All values are represented as integer numbers of LSBs of weight 2**-K
+    K = np.maximum(a_fmt.F - min_shifts, rF)
+    
+    # Calculate the extreme results
+    rmax = amax_int << (K - a_fmt.F + max_shifts)
+    if amin_int < 0:
+        rmin = amin_int << (K - a_fmt.F + max_shifts)
+    else:
+        rmin = amin_int << (K - a_fmt.F + min_shifts)
+    # Sanity checks
+    if __debug__:
+        extremes = [x << (K - a_fmt.F + shifts) for x in (amax_int, amin_int) for shifts in (min_shifts, max_shifts)]
+        assert np.all(rmax == max_of(*extremes))
+        assert np.all(rmin == min_of(*extremes))
+    
+    # The optimal number of frac bits is trivial: a_fmt.F - min_shift.
+    # Scaling the (small) integers by 2.0**-K to real values is exact.
+    check_formats("shift", r_fmts, rmax * 2.0**-K, rmin * 2.0**-K, a_fmt.F - min_shifts,
+                  describe=lambda i: f"a_fmt: {a_fmt}, min_shift: {min_shifts[i]}, max_shift: {max_shifts[i]}")
+
+#################################
+# Unary operations (all a_fmts) #
+#################################
+
+def check_unary_ops():
+    
+    ##############
+    # cl_fix_neg #
+    ##############
+    
+    # Calculate the extreme results
+    rmax = -amins
+    rmin = -amaxs
+    # Sanity checks
+    assert np.all(rmax == max_of(-amaxs, -amins))
+    assert np.all(rmin == min_of(-amaxs, -amins))
+    
+    # Formats to test. The optimal number of frac bits is trivial: a_fmt.F
+    r_fmts = [FixFormat.for_neg(a_fmt) for a_fmt in a_fmts]
+    check_unary_op("neg", a_fmts, r_fmts, rmax, rmin, a_F)
+    
+    ##############
+    # cl_fix_abs #
+    ##############
+    
+    # Calculate the extreme results
+    rmax = np.maximum(amaxs, -amins)
+    rmin = np.minimum(amins, -amaxs)
+    # Sanity checks
+    assert np.all(rmax == max_of(amaxs, amins, -amaxs, -amins))
+    assert np.all(rmin == min_of(amaxs, amins, -amaxs, -amins))
+    
+    # Formats to test. The optimal number of frac bits is trivial: a_fmt.F
+    r_fmts = [FixFormat.for_abs(a_fmt) for a_fmt in a_fmts]
+    check_unary_op("abs", a_fmts, r_fmts, rmax, rmin, a_F)
+
+#########################
+# pytest test functions #
+#########################
+
+# The checks can also be run with pytest: python -m pytest format_tests.py
+# Each a_fmt is a separate test case, so failures are reported per a_fmt and can be re-run in
+# isolation (e.g. with --lf). pytest_generate_tests is used (rather than pytest.mark.parametrize)
+# so that pytest is not required for running this file as a script.
+
+def pytest_generate_tests(metafunc):
+    if "a_index" in metafunc.fixturenames:
+        metafunc.parametrize("a_index", range(len(a_fmts)), ids=[f"a_fmt{a_fmt}" for a_fmt in a_fmts])
+
+def test_unary_ops():
+    check_unary_ops()
+
+def test_binary_ops_and_shift(a_index):
+    check_a_fmt(a_fmts[a_index], amins[a_index], amaxs[a_index])
+
+def test_random_fmts():
+    check_random_fmts(random_seed, random_test_count)
+
+##################
+# Run all checks #
+##################
+
+if __name__ == "__main__":
+    
+    check_unary_ops()
+    
+    # Note: The a_fmts are independent. For parallel execution, use pytest (e.g. with -n auto).
+    for a_fmt, amin, amax in zip(a_fmts, amins, amaxs):
+        check_a_fmt(a_fmt, amin, amax)
+    
+    #######################
+    # Random wide formats #
+    #######################
+    
+    check_random_fmts(random_seed, random_test_count)
@@ -20,6 +20,9 @@
 ---------------------------------------------------------------------------------------------------
 -- Libraries
 ---------------------------------------------------------------------------------------------------
+library std;
+    use std.textio.all;
+
 library ieee;
     use ieee.std_logic_1164.all;
     use ieee.numeric_std.all;
@@ -72,12 +75,11 @@ architecture rtl of cl_fix_shift_tb is
         return to_string(cl_fix_to_real(cl_fix_from_integer(x, XFmt), XFmt));
     end function;
     
-    procedure Check(i : natural) is
-        -- Load response data for this test case
-        constant Expected_c : SlvArray_t := cl_fix_read_file(DataPath_c & "test" & to_string(i) & "_output.txt", RFmt_c(i));
+    procedure Check(i : natural; file OutputFile : text) is
         constant Amin       : integer := cl_fix_to_integer(cl_fix_min_value(AFmt_c(i)), AFmt_c(i));
         constant Amax       : integer := cl_fix_to_integer(cl_fix_max_value(AFmt_c(i)), AFmt_c(i));
         variable Idx_v      : natural := 0;
+        variable Expected_v : std_logic_vector(cl_fix_width(RFmt_c(i))-1 downto 0);
         variable Result_v   : std_logic_vector(cl_fix_width(RFmt_c(i))-1 downto 0);
     begin
         -- The cosim script generates all possible values of both inputs (counters).
@@ -89,13 +91,16 @@ architecture rtl of cl_fix_shift_tb is
                 RFmt_c(i), FixRound_t'val(Rnd_c(i)), FixSaturate_t'val(Sat_c(i))
             );
             
+            -- Load response data (all test cases are stored sequentially in a single file)
+            Expected_v := cl_fix_read(OutputFile, RFmt_c(i));
+            
             -- Check against cosim
-            if Result_v /= Expected_c(Idx_v) then
+            if Result_v /= Expected_v then
                 print(
                     "Error while calculating " & Str(a, AFmt_c(i)) & " " & to_string(AFmt_c(i)) & " << " & to_string(Shift_c(i))
                     & " [rnd: " & to_string(FixRound_t'val(Rnd_c(i))) & ", sat: " & to_string(FixSaturate_t'val(Sat_c(i))) & "] --> " & to_string(RFmt_c(i))
                 );
-                check_equal(Result_v, Expected_c(Idx_v), "Error at index " & to_string(Idx_v));
+                check_equal(Result_v, Expected_v, "Error at index " & to_string(Idx_v));
             end if;
             Idx_v := Idx_v + 1;
             
@@ -115,6 +120,7 @@ begin
     -- VUnit Main --
     ----------------
     p_main : process
+        file OutputFile_f : text;
     begin
         test_runner_setup(runner, runner_cfg);
         
@@ -122,9 +128,12 @@ begin
         
         while test_suite loop
             if run("test") then
+                file_open(OutputFile_f, DataPath_c & "output.txt", read_mode);
+                skip_lines(OutputFile_f, 1);
                 for i in 0 to TestCount_c-1 loop
-                    Check(i);
+                    Check(i, OutputFile_f);
                 end loop;
+                file_close(OutputFile_f);
             end if;
         end loop;
         